@@ -21,7 +21,15 @@ CCD_PIXELS = 3694
 FRAME_HEADER_SIZE = 4
 FRAME_SIZE = FRAME_HEADER_SIZE + CCD_PIXELS * 2
 MAGIC = 0xABCD
+MAGIC_BYTES = struct.pack('<H', MAGIC)  # b'\xcd\xab' on the wire
+FRAME_HEADER = struct.Struct('<HH')     # magic, frame number
 BAUD_RATE = 115200
+SERIAL_RX_BUFFER = 1 << 20  # Windows driver queue; its 4 KB default is under one frame
+USEFUL_START = 32   # First pixel after the leading dummies
+USEFUL_END = 3680   # One past the last pixel before the trailing dummies
+RING_SLOTS = 4  # Frame slots shared between the serial thread and the UI
+REC_INITIAL_FRAMES = 256  # Recording capacity, doubled whenever it fills up
+MAX_FRAME_GAP = 1000  # Larger counter jumps are resets/resyncs, not dropped frames
 
 # ==========================================
 # LOGIC CLASSES
@@ -39,7 +47,9 @@ class SettingsManager:
             "peak_min_dist": 100,
             "last_project": "Default",
             "remove_dummies": False,
-            "y_max": 65535
+            "y_max": 65535,
+            "auto_y": False,
+            "compress_recordings": False # zlib is slow on long recordings
         }
         self.data = self.defaults.copy()
         self.load()
@@ -143,27 +153,19 @@ class PeakDetector:
             processed_data = data
             
         # 2. Thresholding
-        candidates = np.where(processed_data > self.threshold)[0]
-        if len(candidates) == 0: return [], []
+        is_max = processed_data > self.threshold
+        if not is_max.any(): return [], []
         
         # 3. Local Maxima with optimized neighbor check
         #   (d[i] > d[i-1] AND d[i] > d[i+1])
-        #   We use a vectorized approach manually to be safe
-        
-        peaks_x = []
-        peaks_y = []
+        #   Folded into the threshold mask in place, on slices, so no padded
+        #   copy is made. The ends compare against an implicit 0 neighbour,
+        #   which any value above a non-negative threshold already beats.
+        is_max[1:] &= processed_data[1:] > processed_data[:-1]
+        is_max[:-1] &= processed_data[:-1] > processed_data[1:]
+        candidate_indices = np.flatnonzero(is_max)
         
         last_peak_idx = -self.min_distance
-        
-        # Simple Greedy Search on the *processed* data
-        # We look for local maxima
-        
-        # Pre-compute is_peak boolean array
-        padded = np.pad(processed_data, (1, 1), mode='constant', constant_values=0)
-        is_max = (padded[1:-1] > padded[:-2]) & (padded[1:-1] > padded[2:])
-        
-        # Candidate indices are where is_max is true AND value > threshold
-        candidate_indices = np.where(is_max & (processed_data > self.threshold))[0]
 
         # 4. Filter by Min Distance (Greedy Left-to-Right)
         final_peaks_x = []
@@ -181,7 +183,12 @@ class PeakDetector:
 
 class CCDReceiver:
     def __init__(self):
-        self.pixels = np.zeros(CCD_PIXELS, dtype=np.uint16)
+        # Single-producer/single-consumer frame ring: bg_loop only advances
+        # head (after filling the slot), prep_loop only advances tail.
+        self.ring = np.zeros((RING_SLOTS, CCD_PIXELS), dtype=np.uint16)
+        self.head = 0
+        self.tail = 0
+        self.frame_event = threading.Event() # Set whenever head moves
         self.frame_count = 0
         self.fps = 0
         self.running = True
@@ -191,22 +198,29 @@ class CCDReceiver:
         self.last_fps_time = time.time()
         self.fps_frame_count = 0
         self.frozen = False 
-        self.frame_ready = False
         self.single_shot_pending = False
         self.recording = False
         self.recording_conditional = False
-        self.recorded_frames = []
         self.pending_single_shot = False # New flag for "One Shot" logic
+        self._buf = bytearray() # Serial accumulator, scanned for MAGIC_BYTES
+        self._resync = False    # Set by connect(); only read_frame touches _buf
         
         # Frame Averaging
         self.frame_avg_count = 1
-        self.accum_buffer = None
+        self.accum_buffer = np.zeros(CCD_PIXELS, dtype=np.uint32) # Reused for every block
         self.accum_count = 0
         
+        # Recording is kept as parallel per-field arrays, filled up to recorded_count
+        self._reset_recording()
+        
     def connect(self, port):
         if self.serial: self.serial.close()
         try:
             self.serial = serial.Serial(port, BAUD_RATE, timeout=0.5)
+            if os.name == 'nt':
+                # Lets whole frames queue up between reads instead of trickling in
+                self.serial.set_buffer_size(rx_size=SERIAL_RX_BUFFER)
+            self._resync = True
             self.connected = True
             print(f"Connected to {port}")
             return True
@@ -224,53 +238,65 @@ class CCDReceiver:
         if not self.connected or not self.serial: return False
         try:
             while self.running:
-                b = self.serial.read(1)
-                if not b: return False
-                if b[0] == 0xCD:
-                    b2 = self.serial.read(1)
-                    if b2 and b2[0] == 0xAB:
-                        data = self.serial.read(FRAME_SIZE - 2)
-                        if len(data) == FRAME_SIZE - 2:
-                            frame_num = struct.unpack('<H', data[0:2])[0]
-                            # Raw pixels
-                            raw_pixels = np.frombuffer(data[2:], dtype=np.uint16).copy()
-                            
-                            # Frame Averaging Logic
-                            if self.frame_avg_count > 1:
-                                if self.accum_buffer is None:
-                                    self.accum_buffer = raw_pixels.astype(np.float32)
-                                    self.accum_count = 1
-                                else:
-                                    self.accum_buffer += raw_pixels
-                                    self.accum_count += 1
-                                    
-                                if self.accum_count >= self.frame_avg_count:
-                                    final_pixels = (self.accum_buffer / self.accum_count).astype(np.uint16)
-                                    self.accum_buffer = None
-                                    self.accum_count = 0
-                                    # Output this average frame
-                                    with self.lock:
-                                        self.pixels = final_pixels
-                                        self.frame_count = frame_num
-                                        self.frame_ready = True
-                                        self._handle_recording(frame_num, final_pixels)
-                                        self._handle_singleshot()
-                            else:
-                                # No averaging
-                                with self.lock:
-                                    self.pixels = raw_pixels
-                                    self.frame_count = frame_num
-                                    self.frame_ready = True
-                                    self._handle_recording(frame_num, raw_pixels)
-                                    self._handle_singleshot()
-                                    
-                            self.fps_frame_count += 1
-                            now = time.time()
-                            if now - self.last_fps_time >= 1.0:
-                                self.fps = self.fps_frame_count
-                                self.fps_frame_count = 0
-                                self.last_fps_time = now
-                            return True
+                if self._resync:
+                    # Bytes left over from the previous port are meaningless now
+                    self._resync = False
+                    self._buf.clear()
+                idx = self._buf.find(MAGIC_BYTES)
+                if idx < 0:
+                    # No header yet; keep the last byte in case it is half of one
+                    del self._buf[:-1]
+                elif idx > 0:
+                    del self._buf[:idx]
+                    idx = 0
+                if idx == 0 and len(self._buf) >= FRAME_SIZE:
+                    break
+                    
+                # One bulk read instead of a syscall per byte. pyserial's
+                # readinto() is just read() plus a copy, so it would not save
+                # the append below; the pixels are then copied once more,
+                # straight from _buf into their ring slot.
+                want = max(FRAME_SIZE - len(self._buf), self.serial.in_waiting)
+                chunk = self.serial.read(want)
+                if not chunk: return False
+                self._buf += chunk
+            else:
+                return False
+                
+            _, frame_num = FRAME_HEADER.unpack_from(self._buf, 0)
+            # Raw pixels, viewed in place inside the accumulator
+            raw_pixels = np.frombuffer(self._buf, dtype=np.uint16, count=CCD_PIXELS,
+                                       offset=FRAME_HEADER_SIZE)
+            
+            # Frame Averaging Logic
+            if self.frame_avg_count > 1:
+                self.accum_buffer += raw_pixels
+                self.accum_count += 1
+                    
+                if self.accum_count >= self.frame_avg_count:
+                    # Output this average frame (divided in place, then reset)
+                    np.floor_divide(self.accum_buffer, self.accum_count, out=self.accum_buffer)
+                    self._publish(frame_num, self.accum_buffer)
+                    self.accum_buffer.fill(0)
+                    self.accum_count = 0
+            else:
+                # No averaging; drop any block left over from a previous setting
+                if self.accum_count:
+                    self.accum_buffer.fill(0)
+                    self.accum_count = 0
+                self._publish(frame_num, raw_pixels)
+                
+            # The bytearray cannot shrink while a view into it is alive
+            del raw_pixels
+            del self._buf[:FRAME_SIZE]
+                    
+            self.fps_frame_count += 1
+            now = time.time()
+            if now - self.last_fps_time >= 1.0:
+                self.fps = self.fps_frame_count
+                self.fps_frame_count = 0
+                self.last_fps_time = now
+            return True
         except (serial.SerialException, OSError, PermissionError):
             self.disconnect()
             return False
@@ -279,13 +305,65 @@ class CCDReceiver:
             return False
         return False
         
+    def _publish(self, frame_num, pixels):
+        head = self.head
+        slot = self.ring[head % RING_SLOTS]
+        slot[:] = pixels
+        self.frame_count = frame_num
+        self.head = head + 1 # Publish only once the slot is filled
+        self.frame_event.set()
+        with self.lock:
+            self._handle_recording(frame_num, slot)
+        self._handle_singleshot()
+        
     def _handle_recording(self, frame_num, pixels):
         if self.recording or (self.recording_conditional and not self.frozen):
-            self.recorded_frames.append({
-                'frame_num': frame_num,
-                'timestamp': time.time(),
-                'pixels': pixels.copy()
-            })
+            n = self.recorded_count
+            if n == len(self.recorded_frame_nums):
+                self._grow_recording()
+            np.copyto(self.recorded_pixels[n], pixels)
+            self.recorded_frame_nums[n] = frame_num
+            self.recorded_timestamps[n] = time.time() - self.recorded_t0
+            self.recorded_count = n + 1
+            # Remember if averaging was on for any part of the recording
+            if self.frame_avg_count > self.recorded_avg_count:
+                self.recorded_avg_count = self.frame_avg_count
+            
+    def _reset_recording(self):
+        self.recorded_pixels = np.empty((0, CCD_PIXELS), dtype=np.uint16)
+        self.recorded_frame_nums = np.empty(0, dtype=np.uint16)
+        # Seconds since recorded_t0; float32 keeps ms resolution for hours
+        self.recorded_timestamps = np.empty(0, dtype=np.float32)
+        self.recorded_t0 = time.time()
+        self.recorded_avg_count = self.frame_avg_count
+        self.recorded_count = 0
+        
+    def _grow_recording(self):
+        cap = max(2 * len(self.recorded_frame_nums), REC_INITIAL_FRAMES)
+        for name in ('recorded_pixels', 'recorded_frame_nums', 'recorded_timestamps'):
+            old = getattr(self, name)
+            new = np.empty((cap,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+            
+    def start_recording(self):
+        with self.lock:
+            self._reset_recording()
+            self.recording = True
+            
+    def stop_recording(self):
+        """Stop recording, return the filled (pixels, frame_nums, timestamps, t0, avg_count)"""
+        # Only the array handles are swapped under the lock, never copied
+        with self.lock:
+            n = self.recorded_count
+            pixels = self.recorded_pixels
+            frame_nums = self.recorded_frame_nums
+            timestamps = self.recorded_timestamps
+            t0 = self.recorded_t0
+            avg_count = self.recorded_avg_count
+            self._reset_recording()
+            self.recording = False
+        return pixels[:n], frame_nums[:n], timestamps[:n], t0, avg_count
             
     def _handle_singleshot(self):
         if self.pending_single_shot:
@@ -325,6 +403,8 @@ class CCDApp:
         self.receiver.frame_avg_count = self.settings.get("frame_average")
         self.remove_dummies = self.settings.get("remove_dummies")
         self.y_max = self.settings.get("y_max")
+        self.auto_y = self.settings.get("auto_y")
+        self.compress_recordings = self.settings.get("compress_recordings")
         
         self.project_mgr.ensure_project(self.settings.get("last_project"))
         self.project_mgr.current_project = self.settings.get("last_project")
@@ -336,8 +416,31 @@ class CCDApp:
         self.show_peaks = True
         self.show_history = False
         
+        # X coordinates for every pixel, rebuilt only when calibration changes.
+        # DearPyGui takes float64 arrays directly, so no per-frame lists.
+        self.x_axis = np.arange(CCD_PIXELS, dtype=np.float64)
+        # Reused float64 Y buffers for the live and history series. The live
+        # one is double buffered: prep_loop fills y_live[live_back] unlocked,
+        # then publishes it as display_y under display_lock.
+        self.y_live = np.empty((2, CCD_PIXELS), dtype=np.float64)
+        self.live_back = 0
+        self.y_history = np.empty(CCD_PIXELS, dtype=np.float64)
+        self.axis_limits = None # Last (y_top, x_min, x_max) pushed to the plot
+        
+        # Prepared live frame, handed from prep_loop to the UI thread
+        self.display_lock = threading.Lock()
+        self.display_seq = 0 # Bumped per prepared frame; compared before locking
+        self.shown_seq = 0
+        self.display_x = None
+        self.display_y = None
+        self.display_peaks = None
+        self.display_status = ""
+        self.display_peak = None # Largest plotted value of the shown frame
+        
         self.t = threading.Thread(target=self.bg_loop, daemon=True)
         self.t.start()
+        self.prep_t = threading.Thread(target=self.prep_loop, daemon=True)
+        self.prep_t.start()
         
         self.setup_ui()
         
@@ -348,6 +451,22 @@ class CCDApp:
             else:
                 time.sleep(0.5)
 
+    def prep_loop(self):
+        # Consumer side of the ring: all per-frame math runs here so the UI
+        # thread only hands finished arrays to DearPyGui
+        while self.receiver.running:
+            self.receiver.frame_event.wait(0.1)
+            self.receiver.frame_event.clear()
+            head = self.receiver.head
+            if head == self.receiver.tail or self.receiver.frozen: continue
+            # Jump to the newest frame; older unread slots are stale anyway
+            self.receiver.tail = head
+            try:
+                self.prep_frame((head - 1) % RING_SLOTS)
+            except Exception as e:
+                # One bad frame must not end live display for the session
+                print(f"Prep error: {e}")
+
     def save_settings(self):
         self.settings.set("invert_signal", self.invert_signal)
         self.settings.set("enable_savgol", self.peak_detector.use_smoothing)
@@ -358,6 +477,8 @@ class CCDApp:
         self.settings.set("last_project", self.project_mgr.current_project)
         self.settings.set("remove_dummies", self.remove_dummies)
         self.settings.set("y_max", self.y_max)
+        self.settings.set("auto_y", self.auto_y)
+        self.settings.set("compress_recordings", self.compress_recordings)
         self.settings.save()
 
     def refresh_ports(self):
@@ -396,24 +517,43 @@ class CCDApp:
             dpg.configure_item("btn_rec", label="Stop & Save")
 
     def save_recording(self):
-        with self.receiver.lock:
-            frames = self.receiver.recorded_frames
-            self.receiver.recorded_frames = []
-            self.receiver.recording = False
-            
-        if not frames: return
+        pix, nums, stamps, t0, avg_count = self.receiver.stop_recording()
+        if len(nums) == 0: return
         
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         fname = os.path.join(self.project_mgr.get_recording_dir(), f"rec_{ts}.npz")
         
-        n = len(frames)
-        pix = np.zeros((n, CCD_PIXELS), dtype=np.uint16)
-        nums = np.zeros(n, dtype=np.uint16)
-        for i, f in enumerate(frames):
-            pix[i] = f['pixels']
-            nums[i] = f['frame_num']
+        # Dropped frames, expanded without a Python loop. The uint16 diff wraps
+        # along with the firmware's frame counter. Averaged frames skip
+        # frame numbers on purpose, so there is nothing to check then.
+        dropped = np.empty(0, dtype=np.uint16)
+        breaks = np.empty(0, dtype=np.int64) # i where frame i+1 starts a new run
+        if avg_count <= 1 and len(nums) > 1:
+            gaps = np.diff(nums)
+            # A gap is only a drop if the elapsed time could hold it. MCU resets,
+            # reconnects and false resyncs make the counter jump (often
+            # backwards, i.e. by almost 65536), which is a break in the run.
+            plausible = gaps <= MAX_FRAME_GAP
+            elapsed = np.diff(stamps)
+            steady = elapsed[gaps == 1]
+            if steady.size:
+                period = max(float(np.median(steady)), 1e-6)
+                plausible &= gaps <= 2 * np.ceil(elapsed / period) + 1
+            mask = (gaps > 1) & plausible
+            breaks = np.flatnonzero((gaps > 1) & ~plausible)
+            if breaks.size:
+                print(f"{len(breaks)} frame counter discontinuities during recording")
+            counts = gaps[mask].astype(np.int64) - 1
+            if counts.size:
+                starts = np.repeat(nums[:-1][mask].astype(np.int64), counts)
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                dropped = ((starts + offsets + 1) & 0xFFFF).astype(np.uint16)
+                print(f"Dropped {len(dropped)} frames during recording")
             
-        np.savez_compressed(fname, pixels=pix, frame_numbers=nums)
+        # Plain savez is a straight write; savez_compressed runs zlib over everything
+        save = np.savez_compressed if self.compress_recordings else np.savez
+        save(fname, pixels=pix, frame_numbers=nums, dropped_frames=dropped,
+             frame_breaks=breaks, timestamps=stamps, t0=t0)
         print(f"Saved {fname}")
         self.refresh_history_list()
 
@@ -441,9 +581,75 @@ class CCDApp:
         except Exception as e:
             print(f"Load failed: {e}")
 
+    def update_x_axis(self):
+        self.x_axis = np.asarray(self.calibration.pixel_to_nm(np.arange(CCD_PIXELS, dtype=np.float64)),
+                                 dtype=np.float64)
+        
+    def to_display(self, pixels, out):
+        # Inversion and the float64 conversion for DearPyGui in a single pass.
+        # For uint16, 65535 - x is exactly ~x, and bitwise NOT is the cheaper
+        # loop; history files may hold any dtype, so they take the subtract.
+        if self.invert_signal and pixels.dtype == np.uint16:
+            np.invert(pixels, out=out)
+        elif self.invert_signal:
+            np.subtract(65535, pixels, out=out)
+        else:
+            np.copyto(out, pixels)
+        return out
+        
+    def prep_frame(self, slot):
+        # 1. Inversion
+        pixels = self.to_display(self.receiver.ring[slot], self.y_live[self.live_back])
+            
+        # 2. X Axis & Dummy Removal
+        full_x_data = self.x_axis
+            
+        if self.remove_dummies:
+            # Slice logic: Keep USEFUL_START to USEFUL_END
+            start, end = USEFUL_START, USEFUL_END
+            if end > len(pixels): end = len(pixels)
+            display_pixels = pixels[start:end]
+            display_x = full_x_data[start:end]
+            # Adjust indices for peak detection relative to slice if needed, 
+            # but peak detector works on passed array.
+        else:
+            display_pixels = pixels
+            display_x = full_x_data
+            
+        # Auto Y peak of exactly what is plotted (inverted, dummies removed),
+        # off the serial thread and only when it is wanted
+        peak = float(display_pixels.max()) if self.auto_y else None
+            
+        # 3. Peaks (Detect on DISPLAY pixels to match visual)
+        peaks = None
+        if self.show_peaks:
+            px, py = self.peak_detector.find_peaks(display_pixels)
+            if len(px) > 0:
+                # px are indices into display_pixels. 
+                # We need to map them to X coordinates
+                px_indices = px.astype(int)
+                peaks = [display_x[px_indices], py.astype(np.float64)]
+            else:
+                peaks = [[], []]
+                
+        status = f"FPS: {self.receiver.fps} | Frame: {self.receiver.frame_count} | Mode: {self.project_mgr.current_project}"
+        
+        with self.display_lock:
+            self.display_x = display_x
+            self.display_y = display_pixels
+            self.display_peaks = peaks
+            self.display_status = status
+            self.display_peak = peak
+            self.display_seq += 1
+        self.live_back ^= 1
+        
     def update(self):
         # 0. Apply Axis Limits
-        dpg.set_axis_limits("y_axis", 0, self.y_max)
+        y_top = self.y_max
+        if self.auto_y and self.display_peak is not None:
+            # Extremes of the frame on screen, computed by the serial thread,
+            # so freezing also freezes the scale and the UI never scans pixels
+            y_top = max(self.display_peak, 1000)
         
         # Calculate X Limits
         x_min, x_max = 0, CCD_PIXELS
@@ -453,77 +659,46 @@ class CCDApp:
             
         if self.remove_dummies:
             if self.calibration.enabled:
-                x_min = self.calibration.pixel_to_nm(32)
-                x_max = self.calibration.pixel_to_nm(3680)
+                x_min = self.calibration.pixel_to_nm(USEFUL_START)
+                x_max = self.calibration.pixel_to_nm(USEFUL_END)
             else:
-                x_min, x_max = 32, 3680
+                x_min, x_max = USEFUL_START, USEFUL_END
                 
         if x_min > x_max: x_min, x_max = x_max, x_min
-        dpg.set_axis_limits("x_axis", x_min, x_max)
         
-        if self.receiver.frame_ready and not self.receiver.frozen:
-            with self.receiver.lock:
-                self.receiver.frame_ready = False
-                pixels = self.receiver.pixels.copy()
-            
-            # 1. Inversion
-            if self.invert_signal:
-                pixels = 65535 - pixels
-                
-            # 2. X Axis & Dummy Removal
-            if self.calibration.enabled:
-                full_x_data = np.array([self.calibration.pixel_to_nm(i) for i in range(CCD_PIXELS)])
-            else:
-                full_x_data = np.arange(CCD_PIXELS)
-                
-            if self.remove_dummies:
-                # Slice logic: Keep 32 to 3680
-                start, end = 32, 3680
-                if end > len(pixels): end = len(pixels)
-                display_pixels = pixels[start:end]
-                display_x = full_x_data[start:end]
-                # Adjust indices for peak detection relative to slice if needed, 
-                # but peak detector works on passed array.
-            else:
-                display_pixels = pixels
-                display_x = full_x_data
-                
-            dpg.set_value("series_live", [display_x.tolist(), display_pixels.tolist()])
-            
-            # 3. Peaks (Detect on DISPLAY pixels to match visual)
-            if self.show_peaks:
-                px, py = self.peak_detector.find_peaks(display_pixels)
-                if len(px) > 0:
-                    # px are indices into display_pixels. 
-                    # We need to map them to X coordinates
-                    px_indices = px.astype(int)
-                    px_x_coords = display_x[px_indices]
-                    dpg.set_value("series_peaks", [px_x_coords.tolist(), py.tolist()])
-                else:
-                    dpg.set_value("series_peaks", [[], []])
-                     
-            dpg.set_value("status_bar", f"FPS: {self.receiver.fps} | Frame: {self.receiver.frame_count} | Mode: {self.project_mgr.current_project}")
+        # Limits only change on user input (or a new Auto Y peak), so skip
+        # the DearPyGui calls on the render frames where nothing moved
+        limits = (y_top, x_min, x_max)
+        if limits != self.axis_limits:
+            dpg.set_axis_limits("y_axis", 0, y_top)
+            dpg.set_axis_limits("x_axis", x_min, x_max)
+            self.axis_limits = limits
+        
+        # Lock-free check first, so render frames without new data never take
+        # the lock (a stale read just defers the update by one render frame)
+        if self.display_seq != self.shown_seq:
+            with self.display_lock:
+                self.shown_seq = self.display_seq
+                dpg.set_value("series_live", [self.display_x, self.display_y])
+                if self.display_peaks is not None:
+                    dpg.set_value("series_peaks", self.display_peaks)
+                dpg.set_value("status_bar", self.display_status)
 
         if self.show_history and self.history_data:
             idx = dpg.get_value("slider_hist")
-            h_pixels = self.history_data['pixels'][idx]
-            if self.invert_signal: 
-                 h_pixels = 65535 - h_pixels
+            h_pixels = self.to_display(self.history_data['pixels'][idx], self.y_history)
                  
-            if self.calibration.enabled:
-                h_full_x = np.array([self.calibration.pixel_to_nm(i) for i in range(CCD_PIXELS)])
-            else:
-                h_full_x = np.arange(CCD_PIXELS)
+            h_full_x = self.x_axis
                 
             if self.remove_dummies:
-                start, end = 32, 3680
+                start, end = USEFUL_START, USEFUL_END
                 display_h_pixels = h_pixels[start:end]
                 display_h_x = h_full_x[start:end]
             else:
                 display_h_pixels = h_pixels
                 display_h_x = h_full_x
                 
-            dpg.set_value("series_history_line", [display_h_x.tolist(), display_h_pixels.tolist()])
+            dpg.set_value("series_history_line", [display_h_x, display_h_pixels])
 
     def setup_ui(self):
         dpg.create_context()
@@ -572,10 +747,12 @@ class CCDApp:
                             
                             dpg.add_separator()
                             dpg.add_text("View Control")
-                            dpg.add_checkbox(label="Hide Dummy Pixels (32-3680)", default_value=self.remove_dummies,
+                            dpg.add_checkbox(label=f"Hide Dummy Pixels ({USEFUL_START}-{USEFUL_END})", default_value=self.remove_dummies,
                                             callback=lambda s,a: [setattr(self, 'remove_dummies', a), self.save_settings()])
                             dpg.add_slider_int(label="Y Max", default_value=self.y_max, min_value=1000, max_value=65535,
                                               callback=lambda s,a: [setattr(self, 'y_max', a), self.save_settings()])
+                            dpg.add_checkbox(label="Auto Y", default_value=self.auto_y,
+                                            callback=lambda s,a: [setattr(self, 'auto_y', a), self.save_settings()])
                             
                             dpg.add_separator()
                             dpg.add_text("Recording")
@@ -585,6 +762,8 @@ class CCDApp:
                                 dpg.add_input_text(tag="new_proj_name", hint="Project Name")
                                 dpg.add_button(label="Create", callback=self.cb_create_project)
                             dpg.add_button(label="New Project", callback=lambda: dpg.configure_item("proj_win", show=True))
+                            dpg.add_checkbox(label="Compress (slower save)", default_value=self.compress_recordings,
+                                            callback=lambda s,a: [setattr(self, 'compress_recordings', a), self.save_settings()])
                             dpg.add_button(label="Record", tag="btn_rec", callback=self.cb_record_toggle, width=-1, height=40)
 
                         # TAB 2: ANALYSIS
@@ -600,6 +779,7 @@ class CCDApp:
                                     dpg.get_value("cal_p1_px"), dpg.get_value("cal_p1_nm"),
                                     dpg.get_value("cal_p2_px"), dpg.get_value("cal_p2_nm")
                                 )
+                                self.update_x_axis()
                                 dpg.configure_item("x_axis", label=self.calibration.get_axis_label())
                             dpg.add_button(label="Apply Calibration", callback=apply_cal)
                             